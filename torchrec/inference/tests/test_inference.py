@@ -8,6 +8,7 @@
 # @nolint
 # pyre-ignore-all-errors
 
+import copy
 import unittest
 from argparse import Namespace
 
@@ -38,11 +39,12 @@ from torchrec.modules.embedding_modules import EmbeddingBagCollection
 
 
 class InferenceTest(unittest.TestCase):
-    def setUp(self) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
         num_features = 4
         num_weighted_features = 2
 
-        self.tables = [
+        cls.tables = [
             EmbeddingBagConfig(
                 num_embeddings=(i + 1) * 10,
                 embedding_dim=(i + 1) * 4,
@@ -51,7 +53,7 @@ class InferenceTest(unittest.TestCase):
             )
             for i in range(num_features)
         ]
-        self.weighted_tables = [
+        cls.weighted_tables = [
             EmbeddingBagConfig(
                 num_embeddings=(i + 1) * 10,
                 embedding_dim=(i + 1) * 4,
@@ -61,6 +63,24 @@ class InferenceTest(unittest.TestCase):
             for i in range(num_weighted_features)
         ]
 
+        # Building the model is the slow part of these tests, so do it once and
+        # have tests that mutate it (e.g. quantization is inplace) deepcopy it.
+        cls.model = TestSparseNN(
+            tables=cls.tables,
+            weighted_tables=cls.weighted_tables,
+            num_float_features=10,
+            dense_device=torch.device("cpu"),
+            sparse_device=torch.device("cpu"),
+            over_arch_clazz=TestOverArchRegroupModule,
+        )
+        _, cls.local_batch = ModelInput.generate(
+            batch_size=16,
+            world_size=1,
+            num_float_features=10,
+            tables=cls.tables,
+            weighted_tables=cls.weighted_tables,
+        )
+
     def test_dlrm_inference_package(self) -> None:
         args = Namespace()
         args.batch_size = 10
@@ -98,55 +118,49 @@ class InferenceTest(unittest.TestCase):
 
     def test_regroup_module_inference(self) -> None:
         set_propogate_device(True)
-        model = TestSparseNN(
-            tables=self.tables,
-            weighted_tables=self.weighted_tables,
-            num_float_features=10,
-            dense_device=torch.device("cpu"),
-            sparse_device=torch.device("cpu"),
-            over_arch_clazz=TestOverArchRegroupModule,
-        )
-
-        model.eval()
-        _, local_batch = ModelInput.generate(
-            batch_size=16,
-            world_size=1,
-            num_float_features=10,
-            tables=self.tables,
-            weighted_tables=self.weighted_tables,
-        )
-
-        with torch.inference_mode():
-            output = model(local_batch[0])
-
-            # Quantize the model and collect quantized weights
-            quantized_model = quantize_inference_model(model)
-            quantized_output = quantized_model(local_batch[0])
-            table_to_weight = get_table_to_weights_from_tbe(quantized_model)
-
-            # Shard the model, all weights are initialized back to 0, so have to reassign weights
-            sharded_quant_model, _ = shard_quant_model(
-                quantized_model,
-                world_size=2,
-                compute_device="cpu",
-                sharding_device="cpu",
-            )
-            assign_weights_to_tbe(quantized_model, table_to_weight)
-
-            sharded_quant_output = sharded_quant_model(local_batch[0])
-
-            self.assertTrue(torch.allclose(output, quantized_output, atol=1e-4))
-            self.assertTrue(torch.allclose(output, sharded_quant_output, atol=1e-4))
+        batch = self.local_batch[0]
+
+        # (quantization dtype, tolerance against the fp32 output)
+        for quantization_dtype, atol in [
+            (torch.qint8, 1e-4),
+            (torch.quint4x2, 5e-3),
+        ]:
+            with self.subTest(quantization_dtype=quantization_dtype):
+                model = copy.deepcopy(self.model)
+                model.eval()
+
+                with torch.inference_mode():
+                    output = model(batch)
+
+                # Quantize outside of inference mode, int4 weights can't be
+                # converted from inference tensors.
+                quantized_model = quantize_inference_model(
+                    model, quantization_dtype=quantization_dtype
+                )
+
+                with torch.inference_mode():
+                    # Collect quantized weights
+                    quantized_output = quantized_model(batch)
+                    table_to_weight = get_table_to_weights_from_tbe(quantized_model)
+
+                    # Shard the model, all weights are initialized back to 0, so have to reassign weights
+                    sharded_quant_model, _ = shard_quant_model(
+                        quantized_model,
+                        world_size=2,
+                        compute_device="cpu",
+                        sharding_device="cpu",
+                    )
+                    assign_weights_to_tbe(quantized_model, table_to_weight)
+
+                    sharded_quant_output = sharded_quant_model(batch)
+
+                    self.assertTrue(torch.allclose(output, quantized_output, atol=atol))
+                    self.assertTrue(
+                        torch.allclose(output, sharded_quant_output, atol=atol)
+                    )
 
     def test_set_pruning_data(self) -> None:
-        model = TestSparseNN(
-            tables=self.tables,
-            weighted_tables=self.weighted_tables,
-            num_float_features=10,
-            dense_device=torch.device("cpu"),
-            sparse_device=torch.device("cpu"),
-            over_arch_clazz=TestOverArchRegroupModule,
-        )
+        model = copy.deepcopy(self.model)
 
         pruning_dict = {}
 
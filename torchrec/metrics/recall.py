@@ -7,7 +7,7 @@
 
 # pyre-strict
 
-from typing import Any, cast, Dict, List, Optional, Type
+from typing import Any, cast, Dict, List, Optional, Tuple, Type
 
 import torch
 from torchrec.metrics.metrics_namespace import MetricName, MetricNamespace, MetricPrefix
@@ -26,31 +26,30 @@ THRESHOLD = "threshold"
 def compute_recall(
     num_true_positives: torch.Tensor, num_false_negitives: torch.Tensor
 ) -> torch.Tensor:
+    num_positives = num_true_positives + num_false_negitives
     return torch.where(
-        num_true_positives + num_false_negitives == 0.0,
+        num_positives == 0.0,
         0.0,
-        num_true_positives / (num_true_positives + num_false_negitives),
+        num_true_positives / num_positives,
     )
 
 
-def compute_true_pos_sum(
-    labels: torch.Tensor,
-    predictions: torch.Tensor,
-    weights: torch.Tensor,
-    threshold: float = 0.5,
-) -> torch.Tensor:
-    predictions = predictions.double()
-    return torch.sum(weights * ((predictions >= threshold) * labels), dim=-1)
-
-
-def compute_false_neg_sum(
-    labels: torch.Tensor,
-    predictions: torch.Tensor,
-    weights: torch.Tensor,
-    threshold: float = 0.5,
-) -> torch.Tensor:
-    predictions = predictions.double()
-    return torch.sum(weights * ((predictions <= threshold) * labels), dim=-1)
+def _get_threshold_bounds(threshold: float, dtype: torch.dtype) -> Tuple[float, float]:
+    """
+    Returns the (lower, upper) bounds, exactly representable in `dtype`, such
+    that `predictions >= lower` and `predictions <= upper` give the same result
+    as comparing `predictions` against `threshold` in fp64. `lower` is the
+    smallest value of `dtype` that is >= threshold, `upper` the largest value of
+    `dtype` that is <= threshold.
+    """
+    rounded = torch.tensor(threshold, dtype=dtype)
+    lower = rounded
+    if rounded.item() < threshold:
+        lower = torch.nextafter(rounded, rounded.new_tensor(float("inf")))
+    upper = rounded
+    if rounded.item() > threshold:
+        upper = torch.nextafter(rounded, rounded.new_tensor(float("-inf")))
+    return lower.item(), upper.item()
 
 
 def get_recall_states(
@@ -58,12 +57,21 @@ def get_recall_states(
     predictions: torch.Tensor,
     weights: Optional[torch.Tensor],
     threshold: float = 0.5,
+    threshold_bounds: Optional[Tuple[float, float]] = None,
 ) -> Dict[str, torch.Tensor]:
-    if weights is None:
-        weights = torch.ones_like(predictions)
+    if not predictions.is_floating_point():
+        predictions = predictions.double()
+    # Compare in the predictions' own dtype against bounds that are exact in
+    # that dtype, which matches an fp64 compare without upcasting predictions.
+    if threshold_bounds is None:
+        threshold_bounds = _get_threshold_bounds(threshold, predictions.dtype)
+    lower, upper = threshold_bounds
+    # true positives and false negatives share the same weighted labels, so
+    # compute them once and reuse for both reductions.
+    weighted_labels = labels if weights is None else weights * labels
     return {
-        "true_pos_sum": compute_true_pos_sum(labels, predictions, weights, threshold),
-        "false_neg_sum": compute_false_neg_sum(labels, predictions, weights, threshold),
+        "true_pos_sum": torch.sum(weighted_labels * (predictions >= lower), dim=-1),
+        "false_neg_sum": torch.sum(weighted_labels * (predictions <= upper), dim=-1),
     }
 
 
@@ -96,6 +104,12 @@ class RecallMetricComputation(RecMetricComputation):
             persistent=True,
         )
         self._threshold: float = threshold
+        # The threshold never changes, so compute its bounds once per
+        # prediction dtype instead of on every update.
+        self._threshold_bounds: Dict[torch.dtype, Tuple[float, float]] = {
+            dtype: _get_threshold_bounds(threshold, dtype)
+            for dtype in (torch.float16, torch.bfloat16, torch.float32, torch.float64)
+        }
 
     @pt2_compile_callable
     def update(
@@ -110,7 +124,13 @@ class RecallMetricComputation(RecMetricComputation):
             raise RecMetricException(
                 "Inputs 'predictions' should not be None for RecallMetricComputation update"
             )
-        states = get_recall_states(labels, predictions, weights, self._threshold)
+        states = get_recall_states(
+            labels,
+            predictions,
+            weights,
+            self._threshold,
+            self._threshold_bounds.get(predictions.dtype),
+        )
         num_samples = predictions.shape[-1]
 
         for state_name, state_value in states.items():
@@ -119,22 +139,31 @@ class RecallMetricComputation(RecMetricComputation):
             self._aggregate_window_state(state_name, state_value, num_samples)
 
     def _compute(self) -> List[MetricComputationReport]:
+        # Compute lifetime and window recall together as one [2, n_tasks] batch.
+        recall = compute_recall(
+            torch.stack(
+                [
+                    cast(torch.Tensor, self.true_pos_sum),
+                    self.get_window_state("true_pos_sum"),
+                ]
+            ),
+            torch.stack(
+                [
+                    cast(torch.Tensor, self.false_neg_sum),
+                    self.get_window_state("false_neg_sum"),
+                ]
+            ),
+        )
         reports = [
             MetricComputationReport(
                 name=MetricName.RECALL,
                 metric_prefix=MetricPrefix.LIFETIME,
-                value=compute_recall(
-                    cast(torch.Tensor, self.true_pos_sum),
-                    cast(torch.Tensor, self.false_neg_sum),
-                ),
+                value=recall[0],
             ),
             MetricComputationReport(
                 name=MetricName.RECALL,
                 metric_prefix=MetricPrefix.WINDOW,
-                value=compute_recall(
-                    self.get_window_state("true_pos_sum"),
-                    self.get_window_state("false_neg_sum"),
-                ),
+                value=recall[1],
             ),
         ]
         return reports
@@ -171,6 +171,23 @@ def generate_model_outputs_cases() -> Iterable[Dict[str, Union[float, torch.Tens
             "threshold": 0.1,
             "expected_recall": torch.tensor([0.0]),
         },
+        # prediction_equal_to_threshold, 0.6 is not exactly representable in fp32
+        {
+            "labels": torch.tensor([[1, 1]]),
+            "predictions": torch.tensor([[0.6, 0.7]]),
+            "weights": torch.tensor([[1] * 2]),
+            "threshold": 0.6,
+            "expected_recall": torch.tensor([1.0]),
+        },
+        # bf16_predictions_around_threshold, bf16(0.6) is above 0.6 and its
+        # predecessor below it, so each lands on exactly one side
+        {
+            "labels": torch.tensor([[1, 1, 1]]),
+            "predictions": torch.tensor([[0.6, 0.59765625, 0.7]]).bfloat16(),
+            "weights": torch.tensor([[1] * 3]),
+            "threshold": 0.6,
+            "expected_recall": torch.tensor([2.0 / 3.0]),
+        },
     ]
 
 